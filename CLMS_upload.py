@@ -1,5 +1,6 @@
 #!/bin/python
 #usage: CLMS_upload.py -l /tmp/test -b dummy_bucket
+#usage: CLMS_upload.py -L /tmp/file_list.txt -b dummy_bucket
 #export RCLONE_CONFIG_CLMS_TYPE=s3
 #export RCLONE_CONFIG_CLMS_ACCESS_KEY_ID=YOUR_CLMS_PUBLIC_S3_KEY
 #export RCLONE_CONFIG_CLMS_SECRET_ACCESS_KEY=YOUR_CLMS_PRIVATE_S3_KEY
@@ -21,27 +22,54 @@ if not rclone.is_installed():
 parser = OptionParser()
 parser.add_option("-b", "--bucket", dest="producer_bucket",help="path to S3 bucket of the CLMS producer",default=False)
 parser.add_option("-l", "--local-file", dest="local_file",help="local path (i.e. file system) path to input file",default=False)
+parser.add_option("-L", "--file-list", dest="file_list",help="path to a newline-delimited list of input files to upload in one process",default=False)
 parser.add_option("-o", "--overwrite", dest="overwrite",help="shall the uploaded S3 product be replaced in the CLMS producer bucket.",default=True,action='store_false')
 (opt, args) = parser.parse_args()
 if not bool(opt.producer_bucket):
 	print('ERROR:No producer_bucket!')
 	exit(1)
+
+def upload_one(local_file):
+	#format the timestamp once and reuse it in every field that needs it
+	timestamp=datetime.now()
+	uploaded=timestamp.strftime('%Y-%m-%dT%H:%M:%S')
+	date_prefix=timestamp.strftime('/%Y/%m/%d/')
+	last_modified=datetime.fromtimestamp(path.getmtime(local_file)).strftime('%Y-%m-%dT%H:%M:%S')
+	file_size=str(path.getsize(local_file))
+	hasher=md5()
+	buffer=memoryview(bytearray(1<<20))
+	f = open(local_file, 'rb')
+	while n:=f.readinto(buffer):
+		hasher.update(buffer[:n])
+	f.close()
+	md5_checksum=hasher.hexdigest()
+	#all object metadata in one dict; no quotes inside values (rclone stores the quotes verbatim)
+	metadata={
+		'uploaded':uploaded,
+		'WorkflowName':'clms_upload',
+		'source-s3-endpoint-url':environ['RCLONE_CONFIG_CLMS_ENDPOINT'],
+		'source-s3-path':opt.producer_bucket+date_prefix+path.basename(local_file),
+		'file-size':file_size,
+		'last-modified':last_modified}
+	args=['--s3-no-check-bucket','--retries=20','--low-level-retries=20','--checksum','--s3-chunk-size=16M','--s3-upload-concurrency=8','--s3-upload-cutoff=64M','--metadata']
+	args+=['--metadata-set '+key+'='+value for key,value in metadata.items()]
+	rclone.copy(local_file,'CLMS:'+opt.producer_bucket+date_prefix,ignore_existing=opt.overwrite,args=args)
+
 if bool(opt.local_file):
-	if not path.exists(opt.local_file):
-		print('ERROR:File does not exists:'+opt.local_file)
-		exit(1)			
-	try:
-		timestamp=datetime.now()
-		last_modified=datetime.fromtimestamp(path.getmtime(opt.local_file)).strftime('%Y-%m-%dT%H:%M:%S')
-		file_size=str(path.getsize(opt.local_file))
-		f = open(opt.local_file, 'rb')
-		md5_checksum=md5(f.read()).hexdigest()
-		f.close()
-		rclone.copy(opt.local_file,'CLMS:'+opt.producer_bucket+timestamp.strftime('/%Y/%m/%d/'),ignore_existing=opt.overwrite,args=['--s3-no-check-bucket','--retries=20','--low-level-retries=20','--checksum','--s3-use-multipart-uploads=false','--metadata','--metadata-set uploaded='+timestamp.strftime('%Y-%m-%dT%H:%M:%S'), '--metadata-set WorkflowName="clms_upload"','--metadata-set source-s3-endpoint-url="'+environ['RCLONE_CONFIG_CLMS_ENDPOINT']+'"','--metadata-set source-s3-path="'+opt.producer_bucket+timestamp.strftime('/%Y/%m/%d/')+path.basename(opt.local_file)+'"','--metadata-set file-size='+file_size,'--metadata-set last-modified='+last_modified])
-	except:
-		print('ERROR:Uploading file:'+opt.local_file)
-		print_exc()
-		exit(1)		
+	local_files=[opt.local_file]
+elif bool(opt.file_list):
+	local_files=[line.strip() for line in open(opt.file_list) if line.strip()]
 else:
 	print('ERROR:No input file provided!')
 	exit(1)
+#one process for the whole list: Python startup and rclone detection are paid once
+for local_file in local_files:
+	if not path.exists(local_file):
+		print('ERROR:File does not exists:'+local_file)
+		exit(1)
+	try:
+		upload_one(local_file)
+	except:
+		print('ERROR:Uploading file:'+local_file)
+		print_exc()
+		exit(1)
@@ -7,7 +7,7 @@ A tool for uploading files to CLMS S3 storage.
 
 Requirements
 -----------
-- Python 3.6+
+- Python 3.8+
 - rclone installed on the system (https://rclone.org/install/)
 - rclone_python package (pip install rclone_python configparser)
 - Access to CLMS S3 storage (credentials required)
@@ -25,6 +25,8 @@ python CRYOHYDRO_uploader.py -l /path/to/file -p destination/path
 Command Line Options
 ------------------
 -l, --local-file       Path to the file to upload
+-L, --file-list        Path to a newline-delimited list of files to upload
+-j, --jobs             Number of parallel uploads in --file-list mode
 -p, --path-s3          Destination path in S3 bucket
 -c, --credentials_path Path to the credential file
 -o, --overwrite        Overwrites existing files in the destination bucket
@@ -35,9 +37,22 @@ License: MIT
 Version: 0.0.10
 """
 
+import atexit
 import configparser
+import hashlib
+import http.client
+import json
+import mmap
+import multiprocessing
 import os
+import posixpath
+import subprocess
+import threading
+import time
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
 from hashlib import md5
 from optparse import OptionParser
 from os import path
@@ -53,9 +68,40 @@ if importlib.util.find_spec(package_name) is None:
 else:
 	from rclone_python import rclone
 
-if not rclone.is_installed():
+@lru_cache(maxsize=1)
+def rclone_installed() -> bool:
+	"""Cached rclone binary detection (is_installed shells out to rclone each call)"""
+	return rclone.is_installed()
+
+if not rclone_installed():
 	print("rclone binary not detected. Please see: https://rclone.org/install/")
 
+if importlib.util.find_spec('boto3') is None:
+	boto3 = None
+	print("boto3 is not installed. Uploads will fall back to rclone. Please see: https://pypi.org/project/boto3/")
+else:
+	import boto3
+	import botocore.config
+	from boto3.s3.transfer import TransferConfig
+
+	# Grow the http.client write buffer (default 8 KiB) so botocore sends
+	# large bodies in far fewer socket calls.
+	http.client.HTTPConnection.__init__.__defaults__ = tuple(
+		1 << 20 if default == 8192 else default
+		for default in http.client.HTTPConnection.__init__.__defaults__
+	)
+
+BUCKET = 'CLMS-CRYOHYDRO-INGESTION'
+MULTIPART_CUTOFF = 64 << 20
+MULTIPART_CHUNKSIZE = 16 << 20
+MULTIPART_CONCURRENCY = 8
+
+# Static per-upload settings, built once instead of per call
+RC_DST_OPTIONS = 'no_check_bucket=true,chunk_size=16M,upload_concurrency=8,upload_cutoff=64M'
+RC_COPY_CONFIG = {'Metadata': True, 'LowLevelRetries': 20}
+if boto3 is not None:
+	TRANSFER_CONFIG = TransferConfig(multipart_threshold=MULTIPART_CUTOFF)
+
 @dataclass
 class UploadConfig:
 	rclone_type: str
@@ -75,62 +121,388 @@ class CredentialsError(Exception):
 	pass
 
 
+RC_ADDR = '127.0.0.1:5572'
+_rc_daemon = None
+_rc_daemon_lock = threading.Lock()
+
+
+def rc_call(command: str, payload: dict) -> dict:
+	"""POST one JSON request to the rclone remote-control API"""
+	request = urllib.request.Request(
+		f'http://{RC_ADDR}/{command}',
+		data=json.dumps(payload).encode(),
+		headers={'Content-Type': 'application/json'}
+	)
+	with urllib.request.urlopen(request) as response:
+		return json.loads(response.read())
+
+
+def start_rc_daemon() -> None:
+	"""Start a long-lived rclone rcd daemon if one is not already running.
+
+	Spawning a fresh rclone process per copy pays Go runtime startup,
+	config parsing and a new TLS handshake on every file; a single daemon
+	reuses warm connections across all uploads of this process. The lock
+	keeps concurrent --file-list upload threads from racing the
+	check-and-spawn and binding the port against each other.
+	"""
+	global _rc_daemon
+	with _rc_daemon_lock:
+		if _rc_daemon is not None and _rc_daemon.poll() is None:
+			return
+
+		if _rc_daemon is None:
+			atexit.register(stop_rc_daemon)
+		_rc_daemon = subprocess.Popen(
+			['rclone', 'rcd', f'--rc-addr={RC_ADDR}', '--rc-no-auth'],
+			stdout=subprocess.DEVNULL,
+			stderr=subprocess.DEVNULL
+		)
+		for _ in range(50):
+			try:
+				rc_call('core/version', {})
+				return
+			except Exception:
+				time.sleep(0.1)
+		raise UploadError("rclone rcd daemon did not respond on " + RC_ADDR)
+
+
+def stop_rc_daemon() -> None:
+	"""Terminate the rclone rcd daemon started by this process"""
+	global _rc_daemon
+	if _rc_daemon is not None and _rc_daemon.poll() is None:
+		_rc_daemon.terminate()
+	_rc_daemon = None
+
+
+def calculate_md5(filepath: str) -> str:
+	"""Calculate the MD5 checksum of a file without reading it all into RAM.
+
+	Files above 64 MiB are memory-mapped so hashlib consumes pages straight
+	from the page cache with no userspace copy, with sequential readahead
+	hinted to the kernel. Smaller files go through hashlib.file_digest on
+	Python 3.11+ (read/update loop entirely in C) or a streaming readinto
+	loop on older interpreters; peak memory stays constant either way.
+	"""
+	with open(filepath, 'rb') as f:
+		if hasattr(os, 'posix_fadvise'):
+			os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+		if path.getsize(filepath) > 64 << 20:
+			with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+				if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+					mm.madvise(mmap.MADV_SEQUENTIAL)
+				hasher = md5()
+				hasher.update(mm)
+				return hasher.hexdigest()
+		if hasattr(hashlib, 'file_digest'):
+			return hashlib.file_digest(f, 'md5').hexdigest()
+		hasher = md5()
+		buffer = memoryview(bytearray(1 << 20))
+		while n := f.readinto(buffer):
+			hasher.update(buffer[:n])
+		return hasher.hexdigest()
+
+
+def drop_page_cache(filepath: str) -> None:
+	"""Hint the kernel to evict the file's cached pages after an upload.
+
+	Uploads are write-once: nothing re-reads the file, so letting tens of
+	GB linger in the page cache only evicts hotter data during batch runs.
+	"""
+	if not hasattr(os, 'posix_fadvise'):
+		return
+	fd = os.open(filepath, os.O_RDONLY)
+	try:
+		os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+	finally:
+		os.close(fd)
+
+
 def calculate_file_metadata(filepath: str) -> Dict[str, str]:
-	"""Calculate file metadata including timestamp, size, and MD5 checksum"""
+	"""Calculate file metadata including timestamp and size (MD5 is hashed separately)"""
 	if not os.path.exists(filepath):
 		raise UploadError(f"File does not exist: {filepath}")
 
 	try:
+		# One stat call covers both mtime and size
+		stats = os.stat(filepath)
 		timestamp = datetime.now()
-		last_modified = datetime.fromtimestamp(path.getmtime(filepath)).strftime('%Y-%m-%dT%H:%M:%S')
-		file_size = str(path.getsize(filepath))
-
-		with open(filepath, 'rb') as f:
-			md5_checksum = md5(f.read()).hexdigest()
+		last_modified = datetime.fromtimestamp(stats.st_mtime).strftime('%Y-%m-%dT%H:%M:%S')
+		file_size = str(stats.st_size)
 
 		return {
 			'timestamp': int(timestamp.timestamp()),
 			'last_modified': last_modified,
-			'file_size': file_size,
-			'md5_checksum': md5_checksum
+			'file_size': file_size
 		}
 	except Exception as e:
 		raise UploadError(f"Error calculating file metadata: {str(e)}")
 
 
+def copy_with_backoff(payload: dict, retries: int = 5) -> None:
+	"""Run one rcd copyfile call, retrying failed attempts with exponential backoff"""
+	for attempt in range(retries):
+		try:
+			rc_call('operations/copyfile', payload)
+			return
+		except Exception:
+			if attempt == retries - 1:
+				raise
+			time.sleep(2 ** attempt)
+
+
+_s3_client = None
+_worker_client = None
+
+
+def client_kwargs(config: UploadConfig) -> dict:
+	"""Plain boto3.client keyword arguments, safe to send to worker processes"""
+	return {
+		'endpoint_url': config.endpoint,
+		'aws_access_key_id': config.access_key_id,
+		'aws_secret_access_key': config.secret_access_key,
+		'region_name': config.region
+	}
+
+
+def get_s3_client(config: UploadConfig):
+	"""Return a process-wide boto3 S3 client, created once and reused.
+
+	Each client owns a TLS connection pool; recreating it per upload would
+	pay the handshake and pool warm-up again for every file.
+	"""
+	global _s3_client
+	if _s3_client is None:
+		_s3_client = boto3.client(
+			's3',
+			config=botocore.config.Config(
+				max_pool_connections=32,
+				retries={'max_attempts': 5, 'mode': 'adaptive'}
+			),
+			**client_kwargs(config)
+		)
+	return _s3_client
+
+
+def init_upload_worker(kwargs: dict) -> None:
+	"""Create one S3 client per worker process (boto3 clients are not fork-safe)"""
+	global _worker_client
+	_worker_client = boto3.client(
+		's3',
+		config=botocore.config.Config(retries={'max_attempts': 5, 'mode': 'adaptive'}),
+		**kwargs
+	)
+
+
+_worker_fd = None
+_worker_fd_path = None
+_worker_buffer = None
+
+
+def worker_fd(filepath: str) -> int:
+	"""Per-worker file descriptor for the file currently being uploaded.
+
+	Each worker reads its assigned byte ranges with pread on its own fd,
+	so there is no shared file position to contend on, and the kernel is
+	hinted that each descriptor streams sequentially.
+	"""
+	global _worker_fd, _worker_fd_path
+	if _worker_fd_path != filepath:
+		if _worker_fd is not None:
+			os.close(_worker_fd)
+		_worker_fd = os.open(filepath, os.O_RDONLY)
+		_worker_fd_path = filepath
+		if hasattr(os, 'posix_fadvise'):
+			os.posix_fadvise(_worker_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+	return _worker_fd
+
+
+def upload_file_part(filepath: str, key: str, upload_id: str, part_number: int, offset: int, length: int) -> Dict[str, Union[int, str]]:
+	"""Read one byte range of the source file and upload it as a multipart part.
+
+	Each worker reads into a single pre-allocated chunk-sized buffer that
+	is reused for every part it handles, so batch runs keep a flat memory
+	profile of workers x chunk size instead of churning a fresh allocation
+	per part.
+	"""
+	global _worker_buffer
+	if _worker_buffer is None:
+		_worker_buffer = memoryview(bytearray(MULTIPART_CHUNKSIZE))
+
+	fd = worker_fd(filepath)
+	read = 0
+	while read < length:
+		n = os.preadv(fd, [_worker_buffer[read:length]], offset + read)
+		if n == 0:
+			break
+		read += n
+	body = _worker_buffer[:read]
+	response = _worker_client.upload_part(
+		Bucket=BUCKET,
+		Key=key,
+		UploadId=upload_id,
+		PartNumber=part_number,
+		Body=body
+	)
+	return {'PartNumber': part_number, 'ETag': response['ETag']}
+
+
+def multipart_upload(config: UploadConfig, local_file: str, key: str, metadata: Dict[str, str]) -> None:
+	"""Upload a large file as S3 multipart parts fanned out over worker processes.
+
+	Threads serialize on the GIL for the TLS/HTTP work botocore does per
+	part, so the parts go to separate processes instead; the main process
+	only orchestrates create/complete.
+	"""
+	file_size = path.getsize(local_file)
+	offsets = range(0, file_size, MULTIPART_CHUNKSIZE)
+	workers = min(os.cpu_count() or 1, MULTIPART_CONCURRENCY, len(offsets))
+
+	client = get_s3_client(config)
+	upload_id = client.create_multipart_upload(Bucket=BUCKET, Key=key, Metadata=metadata)['UploadId']
+
+	try:
+		# Spawned (not forked) workers: by this point the parent holds live
+		# TLS connections and, in --file-list mode, other upload threads,
+		# which forking can leave in a deadlocked state. Workers build all
+		# their own state in init_upload_worker anyway.
+		with ProcessPoolExecutor(
+			max_workers=workers,
+			mp_context=multiprocessing.get_context('spawn'),
+			initializer=init_upload_worker,
+			initargs=(client_kwargs(config),)
+		) as executor:
+			# Sliding window: keep exactly `workers` parts in flight and
+			# issue the next one as soon as any finishes, so a slow part
+			# never stalls a whole batch of submissions.
+			parts = []
+			inflight = set()
+			for part_number, offset in enumerate(offsets, start=1):
+				if len(inflight) == workers:
+					done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+					parts.extend(future.result() for future in done)
+				inflight.add(executor.submit(
+					upload_file_part,
+					local_file,
+					key,
+					upload_id,
+					part_number,
+					offset,
+					min(MULTIPART_CHUNKSIZE, file_size - offset)
+				))
+			done, _ = wait(inflight)
+			parts.extend(future.result() for future in done)
+
+		parts.sort(key=lambda part: part['PartNumber'])
+		client.complete_multipart_upload(
+			Bucket=BUCKET,
+			Key=key,
+			UploadId=upload_id,
+			MultipartUpload={'Parts': parts}
+		)
+	except Exception:
+		client.abort_multipart_upload(Bucket=BUCKET, Key=key, UploadId=upload_id)
+		raise
+
+
+def pusher_boto3(config: UploadConfig, local_file: str, s3_path: str, overwrite: bool = True) -> None:
+	"""Upload file to S3 with metadata through the shared boto3 client"""
+	metadata = calculate_file_metadata(local_file)
+	key = posixpath.join(s3_path, os.path.basename(local_file))
+	client = get_s3_client(config)
+
+	# One HEAD request answers both skip questions without touching the disk
+	try:
+		remote_etag = client.head_object(Bucket=BUCKET, Key=key)['ETag'].strip('"')
+	except client.exceptions.ClientError:
+		remote_etag = None
+
+	if remote_etag is not None and not overwrite:
+		return
+
+	# The checksum has to travel with the object metadata here, so it is
+	# computed up front rather than overlapped with the transfer.
+	md5_checksum = calculate_md5(local_file)
+
+	# For non-multipart objects the ETag is the plain MD5, so a match means
+	# the remote copy is already identical and the upload can be skipped.
+	if remote_etag == md5_checksum:
+		return
+
+	metadata_set = {
+		'uploaded': str(metadata['timestamp']),
+		'WorkflowName': 'clms_upload',
+		'source-s3-endpoint-url': config.endpoint,
+		'source-s3-path': f's3://{posixpath.join(BUCKET, key)}',
+		'file-size': metadata['file_size'],
+		'md5': md5_checksum,
+		'last_modified': metadata['last_modified'],
+		's3-public-key': config.access_key_id
+	}
+
+	if path.getsize(local_file) > MULTIPART_CUTOFF:
+		multipart_upload(config, local_file, key, metadata_set)
+	else:
+		client.upload_file(
+			local_file,
+			BUCKET,
+			key,
+			ExtraArgs={'Metadata': metadata_set},
+			Config=TRANSFER_CONFIG
+		)
+
+
 def pusher(config: UploadConfig, local_file: str, s3_path: str, overwrite: bool = True) -> None:
 	"""Upload file to S3 with metadata"""
 	if not local_file or not s3_path:
 		raise UploadError("Both local_file and s3_path must be provided")
 
-	# Normalize S3 path
-	s3_path = s3_path.rstrip('/')
+	# Normalize S3 path once; all joins below are then free of '//' fix-ups
+	s3_path = s3_path.strip('/')
 
 	try:
+		if boto3 is not None:
+			pusher_boto3(config, local_file, s3_path, overwrite)
+			drop_page_cache(local_file)
+			return
+
 		metadata = calculate_file_metadata(local_file)
-		destination = f'CRYOHYDRO:CLMS-CRYOHYDRO-INGESTION/{s3_path}'.replace('//', '/')
+		bucket_path = posixpath.join(BUCKET, s3_path)
+		dst_fs = f'CRYOHYDRO,{RC_DST_OPTIONS}:{bucket_path}'
+		local_dir, local_name = os.path.split(os.path.abspath(local_file))
+
+		# The checksum has to travel with the object metadata (rclone skips
+		# a copy whose source and destination are the same object, so it
+		# cannot be attached after the fact), which means hashing up front
+		# rather than overlapped with the transfer, as in pusher_boto3.
+		md5_checksum = calculate_md5(local_file)
+
+		metadata_set = {
+			'uploaded': str(metadata['timestamp']),
+			'WorkflowName': 'clms_upload',
+			'source-s3-endpoint-url': config.endpoint,
+			'source-s3-path': f's3://{posixpath.join(bucket_path, local_name)}',
+			'file-size': metadata['file_size'],
+			'md5': md5_checksum,
+			'last_modified': metadata['last_modified'],
+			's3-public-key': config.access_key_id
+		}
 
-		rclone.copy(
-			local_file,
-			destination,
-			ignore_existing=overwrite,
-			args=[
-				'--s3-no-check-bucket',
-				'--retries=20',
-				'--low-level-retries=20',
-				'--checksum',
-				'--s3-use-multipart-uploads=false',
-				'--metadata',
-				f'--metadata-set uploaded={metadata["timestamp"]}',
-				'--metadata-set WorkflowName="clms_upload"',
-				f'--metadata-set source-s3-endpoint-url={config.endpoint}',
-				f'--metadata-set source-s3-path=s3://{os.path.join("CLMS-CRYOHYDRO-INGESTION", s3_path, os.path.basename(local_file)).replace("//", "/")}',
-				f'--metadata-set file-size={metadata["file_size"]}',
-				f'--metadata-set md5={metadata["md5_checksum"]}',
-				f'--metadata-set last_modified={metadata["last_modified"]}',
-				f'--metadata-set s3-public-key={config.access_key_id}'
-			]
-		)
+		payload = {
+			'srcFs': local_dir,
+			'srcRemote': local_name,
+			'dstFs': dst_fs,
+			'dstRemote': local_name,
+			'_config': {
+				**RC_COPY_CONFIG,
+				'MetadataSet': metadata_set,
+				'IgnoreExisting': not overwrite
+			}
+		}
+
+		start_rc_daemon()
+		copy_with_backoff(payload)
+		drop_page_cache(local_file)
 	except Exception as e:
 		raise UploadError(f"Error uploading file {local_file}: {str(e)}")
 
@@ -144,16 +516,19 @@ def parse_credentials(credentials_path: Path) -> Tuple[str, str]:
 			raise CredentialsError(f"Credentials file not found: {credentials_path}")
 
 		with credentials_path.open('r') as f:
-			lines = [line.strip() for line in f if line.strip()]
-
-			if not lines:
-				raise CredentialsError("Credentials file is empty")
-
-			try:
-				access_key_id, secret_access_key = lines[0].split(':')
-				return access_key_id.strip(), secret_access_key.strip()
-			except ValueError:
-				raise CredentialsError("Invalid credentials format. Expected 'access_key_id:secret_access_key'")
+			# Only the first non-empty line matters; stop there instead of
+			# materialising the whole file.
+			for line in f:
+				line = line.strip()
+				if not line:
+					continue
+				try:
+					access_key_id, secret_access_key = line.split(':', 1)
+					return access_key_id.strip(), secret_access_key.strip()
+				except ValueError:
+					raise CredentialsError("Invalid credentials format. Expected 'access_key_id:secret_access_key'")
+
+			raise CredentialsError("Credentials file is empty")
 
 	except Exception as e:
 		if isinstance(e, CredentialsError):
@@ -185,8 +560,9 @@ def rclone_setup(credentials_path: Path) -> None:
 		raise UploadError(f"Error setting up rclone: {str(e)}")
 
 
+@lru_cache(maxsize=1)
 def config_settings(config_path: str) -> UploadConfig:
-	"""Read and parse a configuration file"""
+	"""Read and parse a configuration file (cached, so batch callers parse it once)"""
 	if not os.path.exists(config_path):
 		raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
@@ -252,6 +628,21 @@ Notes:
 		metavar="FILE"
 	)
 
+	parser.add_option(
+		"-L", "--file-list",
+		dest="file_list",
+		help="Path to a newline-delimited list of local files to upload in one process",
+		metavar="FILE"
+	)
+
+	parser.add_option(
+		"-j", "--jobs",
+		dest="jobs",
+		type="int",
+		default=4,
+		help="Number of parallel uploads in --file-list mode (default: 4)"
+	)
+
 	parser.add_option(
 		"-o", "--overwrite",
 		dest="overwrite",
@@ -270,6 +661,8 @@ Optional Arguments:
   -h, --help                     Show this help message and exit
   --version                      Show program's version number and exit
   -c FILE, --credentials=FILE    S3 credentials file (required for first use)
+  -L FILE, --file-list=FILE      Upload every file listed (one path per line)
+  -j N, --jobs=N                 Parallel uploads in --file-list mode
   -o, --no-overwrite            Do not overwrite existing files
 
 Environment Setup:
@@ -293,11 +686,34 @@ Return Codes:
 			raise UploadError("S3 credentials not present. Please provide credentials using -c/--credentials-path")
 		config = config_settings(config_path)
 
-		if not options.local_file or not options.s3_path:
-			parser.error("Both --local-file and --path-s3 are required")
-
-		pusher(config, options.local_file, options.s3_path, options.overwrite)
-		print(f"Successfully uploaded {options.local_file}")
+		if not options.s3_path or not (options.local_file or options.file_list):
+			parser.error("--path-s3 plus either --local-file or --file-list are required")
+
+		if options.file_list:
+			with open(options.file_list) as f:
+				local_files = [line.strip() for line in f if line.strip()]
+
+			# One process for the whole batch: Python startup, rclone
+			# detection, config parsing and the S3 session are paid once
+			# and shared across all uploads.
+			failed = []
+			with ThreadPoolExecutor(max_workers=max(options.jobs, 1)) as executor:
+				futures = {
+					executor.submit(pusher, config, local_file, options.s3_path, options.overwrite): local_file
+					for local_file in local_files
+				}
+				for future, local_file in futures.items():
+					try:
+						future.result()
+						print(f"Successfully uploaded {local_file}")
+					except Exception as e:
+						failed.append(local_file)
+						print(f"Error: {str(e)}")
+			if failed:
+				raise UploadError(f"{len(failed)} of {len(local_files)} uploads failed")
+		else:
+			pusher(config, options.local_file, options.s3_path, options.overwrite)
+			print(f"Successfully uploaded {options.local_file}")
 
 	except KeyboardInterrupt:
 		print("\nUpload interrupted by user")
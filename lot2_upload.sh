@@ -76,5 +76,5 @@ timestamp=$(date -u -d now '+%Y-%m-%dT%H:%M:%S')
 last_modified=$(date -r $local_file '+%Y-%m-%dT%H:%M:%S')
 file_size=$(du -smb --apparent-size $local_file | cut -f1)
 md5_checksum=$(md5sum -b $local_file | cut -c-32)
-rclone copy --s3-no-check-bucket --retries=20 --low-level-retries=20 --checksum --s3-use-multipart-uploads='false' --metadata --metadata-set uploaded=$timestamp --metadata-set WorkflowName="lot2_upload" --metadata-set source-s3-endpoint-url=$RCLONE_CONFIG_CLMS_ENDPOINT --metadata-set file-size=$file_size --metadata-set md5=$md5_checksum --metadata-set last_modified=$last_modified --metadata-set s3-public-key=${RCLONE_CONFIG_CLMS_ACCESS_KEY_ID} --metadata-set source_s3_path='s3://CLMS-ARCHIVE-LOT2/'${s3_path}/$(basename $local_file) --metadata-set source_cleanup=true --metadata-set product_to_replace='' $local_file LOT2:CLMS-ARCHIVE-LOT2/$s3_path
+rclone copy --s3-no-check-bucket --retries=20 --low-level-retries=20 --checksum --s3-chunk-size=16M --s3-upload-concurrency=8 --s3-upload-cutoff=64M --metadata --metadata-set uploaded=$timestamp --metadata-set WorkflowName="lot2_upload" --metadata-set source-s3-endpoint-url=$RCLONE_CONFIG_CLMS_ENDPOINT --metadata-set file-size=$file_size --metadata-set md5=$md5_checksum --metadata-set last_modified=$last_modified --metadata-set s3-public-key=${RCLONE_CONFIG_CLMS_ACCESS_KEY_ID} --metadata-set source_s3_path='s3://CLMS-ARCHIVE-LOT2/'${s3_path}/$(basename $local_file) --metadata-set source_cleanup=true --metadata-set product_to_replace='' $local_file LOT2:CLMS-ARCHIVE-LOT2/$s3_path
 [ $? == 1 ] && echo "ERROR: Failed to upload $local_file" || echo "SUCCESS: Uploaded $local_file"